@@ -1,6 +1,6 @@
 """
 This script provides a real-time system resource monitoring tool that displays various system metrics in the terminal.
-It uses the `psutil` library to gather system information and the `tabulate` library to format the output in a readable manner.
+It uses the `psutil` library to gather system information and formats the output in readable tables.
 
 Features:
 - Disk Usage: Displays total, used, and free disk space along with a colored usage bar.
@@ -16,29 +16,56 @@ The script uses ANSI escape codes to add color to the terminal output, making it
 
 Functions:
 - get_usage_color(percentage): Returns an ANSI color code based on the CPU usage percentage.
+- visible_len(text): Returns the length of a string as shown on the terminal, without its color codes.
 - create_cpu_usage_bar(percentage, bar_length=10): Returns a string representing an ASCII bar chart of CPU usage with color.
 - create_memory_usage_bar(percentage, bar_length=30): Returns a string representing an ASCII bar chart of memory usage with color.
 - create_disk_usage_bar(percentage, bar_length=30): Returns a string representing an ASCII bar chart of disk usage with color.
 - display_disk_usage(): Displays disk usage statistics with a colored usage bar.
 - display_memory_usage(): Displays memory usage statistics with a colored usage bar.
-- get_cpu_columns(column_width): Determines the number of columns to use for CPU usage display based on terminal width.
-- display_cpu_usage_in_columns(): Displays per-core CPU usage in dynamically adjusted columns with colored bars.
+- get_cpu_percentages(): Returns the per-core CPU usage since the previous call, read directly from /proc/stat on Linux.
+- query_terminal_size(): Asks the terminal for its size, ignoring $COLUMNS and $LINES.
+- update_terminal_size(): Refreshes the cached terminal size, on SIGWINCH.
+- get_cpu_columns(column_width, terminal_width=None): Determines the number of columns to use for CPU usage display based on terminal width.
+- display_cpu_usage_in_columns(cpu_percentages=None, terminal_width=None): Displays per-core CPU usage in dynamically adjusted columns with colored bars.
+- collect_process_usage_procfs(pids): Sums the CPU usage, memory usage and process count per user, straight from /proc.
+- collect_process_usage_psutil(pids): Collects the same through psutil, where /proc is not available.
 - display_user_usage(): Displays cumulative CPU, memory usage, and process count for each user.
 - display_network_usage(): Displays network usage statistics with aligned columns and colored headers.
 - display_load_average(): Displays the system load average for the past 1, 5, and 15 minutes.
 - display_system_info(): Displays system uptime and kernel version.
-- display_disk_io(): Displays live disk I/O statistics including read and write bytes for each disk.
-- clear_console(): Clears the terminal screen.
+- display_disk_io(terminal_width=None): Displays live disk I/O statistics including read and write bytes for each disk.
+- enable_ansi_escapes(): Enables ANSI escape codes on the Windows console.
+- FrameBuffer: Keeps the last rendered frame and only redraws the lines that changed.
+- get_section(name, display, due): Returns the lines of a section, reusing the cached lines when it is not due.
+- request_redraw(): Has the render loop redraw the whole screen, on SIGCONT.
+- is_foreground(): Returns False when running in a background job of the terminal.
+- enabled_sections(args): Returns the sections to show for the command-line options.
+- fetch_section(loop, name, display, due): Gets the lines of a section, querying it on the thread pool.
+- collector(args): Collects the enabled sections every interval, concurrently, publishing them as a Snapshot.
+- run_collector(args): Runs the collector in its own event loop on a background thread.
 - parse_arguments(): Parses command-line arguments for optional features and update interval.
 
 Usage:
 Run the script in a terminal to start real-time monitoring. Use command-line arguments to enable optional features and set the update interval. Press Ctrl+C to exit.
 """
+import array
+import asyncio
+import ctypes
+import functools
+import io
 import os
+import platform
+import sys
 import psutil
+try:
+    import pwd
+except ImportError:  # Windows, where the user usage is collected through psutil
+    pwd = None
+import random
+import re
+import signal
+import threading
 import time
-from collections import defaultdict
-from tabulate import tabulate
 import argparse
 
 # ANSI escape codes for colors
@@ -51,33 +78,144 @@ USER_COLOR      = "\033[1;35m"  # Bold Magenta"
 LOAD_COLOR      = "\033[1;35m"  # Bold Magenta"
 INFO_COLOR      = "\033[1;35m"  # Bold Magenta"
 RESET_COLOR     = "\033[0m"     # Reset to default
-lencolors = len(HEADER_COLOR) + len(RESET_COLOR)
 
 # Additional ANSI escape codes for CPU and memory usage bars
 GREEN = "\033[1;32m"
 YELLOW = "\033[1;33m"
 RED = "\033[1;31m"
 
+# Section headers, built once
+DISK_USAGE_HEADER = f"{DISK_COLOR}=== Disk Usage ==={RESET_COLOR}"
+MEMORY_USAGE_HEADER = f"{MEMORY_COLOR}=== Memory Usage ==={RESET_COLOR}"
+CPU_USAGE_HEADER = f"{CPU_COLOR}=== CPU Usage ==={RESET_COLOR}"
+USER_USAGE_HEADER = f"{USER_COLOR}=== Cumulative User CPU, Memory Usage, and Process Count ==={RESET_COLOR}"
+NETWORK_USAGE_HEADER = f"{NETWORK_COLOR}=== Network Usage ==={RESET_COLOR}"
+LOAD_AVERAGE_HEADER = f"{LOAD_COLOR}=== Load Average ==={RESET_COLOR}"
+SYSTEM_INFO_HEADER = f"{INFO_COLOR}=== System Info ==={RESET_COLOR}"
+DISK_IO_HEADER = f"{DISK_COLOR}=== Disk I/O ==={RESET_COLOR}"
+
+# Byte units
+_MB = 1 << 20
+_GB = 1 << 30
+_TB = 1 << 40
+
+# Their reciprocals, to convert with a multiplication. They are powers of two, so the results are exact
+_INV_MB = 1.0 / _MB
+_INV_GB = 1.0 / _GB
+_INV_TB = 1.0 / _TB
+
+# ANSI escape codes used by the frame renderer
+SYNC_UPDATE_BEGIN = "\033[?2026h"  # Synchronized update: terminal holds the frame until the end marker
+SYNC_UPDATE_END   = "\033[?2026l"
+AUTOWRAP_OFF      = "\033[?7l"     # Over-long lines are cut at the edge instead of shifting the rows below
+AUTOWRAP_ON       = "\033[?7h"
+ERASE_BELOW       = "\033[J"       # Erase from the cursor to the end of the screen
+
+# Matches the color codes, which take no room on the screen
+ANSI_COLOR_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+def visible_len(text):
+    """Returns the length of a string as shown on the terminal, without its color codes."""
+    return len(ANSI_COLOR_RE.sub("", text)) if "\x1b" in text else len(text)
+
+def _table_layout(headers, widths, aligns):
+    """
+    Build the border and header lines of a table in the "pretty" style of tabulate.
+    Args:
+        headers (sequence[str]): The column titles.
+        widths (sequence[int]): The visible width of each column.
+        aligns (sequence[str]): "left" or "right" for each column.
+    Returns:
+        tuple: The border line and the header line.
+    """
+
+    border = "+" + "+".join("-" * (width + 2) for width in widths) + "+"
+    header_line = "| " + " | ".join(
+        header.ljust(width) if align == "left" else header.rjust(width)
+        for header, width, align in zip(headers, widths, aligns)) + " |"
+    return border, header_line
+
+def _format_table(headers, rows, aligns):
+    """
+    Format rows as a table in the "pretty" style of tabulate, sizing the columns on the
+    visible width of the cells so colored cells line up.
+    Args:
+        headers (sequence[str]): The column titles.
+        rows (list[sequence[str]]): The cells of each row, already formatted.
+        aligns (sequence[str]): "left" or "right" for each column.
+    Returns:
+        list[str]: The lines of the table.
+    """
+
+    cell_lens = [[visible_len(cell) for cell in row] for row in rows]
+    widths = [max([len(header)] + [lens[i] for lens in cell_lens]) for i, header in enumerate(headers)]
+    border, header_line = _table_layout(headers, widths, aligns)
+    lines = [border, header_line, border]
+    for row, lens in zip(rows, cell_lens):
+        lines.append("| " + " | ".join(
+            cell + " " * (width - length) if align == "left" else " " * (width - length) + cell
+            for cell, length, width, align in zip(row, lens, widths, aligns)) + " |")
+    lines.append(border)
+    return lines
+
+# Color of each whole percentage from 0 to 100: green below 50, yellow below 80, red above
+_COLOR_BY_PCT = [GREEN] * 50 + [YELLOW] * 30 + [RED] * 21
+
 def get_usage_color(percentage):
     """Returns an ANSI color code based on the CPU usage percentage."""
-    if percentage < 50:
-        return GREEN
-    elif percentage < 80:
-        return YELLOW
-    else:
-        return RED
+    index = int(percentage)
+    if not 0 <= index <= 100:
+        index = 0 if index < 0 else 100
+    return _COLOR_BY_PCT[index]
+
+def _build_bar_prefixes(bar_length):
+    """
+    Build the colored bar part of a usage bar for every percentage from 0 to 100 in steps
+    of 0.01, so it can be looked up with int(percentage * 100). Percentages sharing the same
+    color and fill share the same string object, so the table stays small.
+    Args:
+        bar_length (int): The length of the bar.
+    Returns:
+        list[str]: The 10001 bar prefixes, e.g. "<color>[###       ] ".
+    """
+
+    prefixes = {}
+    table = []
+    for pct_bucket in range(10001):
+        color = get_usage_color(pct_bucket / 100)
+        num_bars = pct_bucket * bar_length // 10000
+        prefix = prefixes.get((color, num_bars))
+        if prefix is None:
+            prefix = prefixes[(color, num_bars)] = f"{color}[{'#' * num_bars}{' ' * (bar_length - num_bars)}] "
+        table.append(prefix)
+    return table
+
+# Bar prefixes for the default bar lengths, built once at import
+CPU_BAR_LENGTH = 10
+CPU_BARS = _build_bar_prefixes(CPU_BAR_LENGTH)
+MEMORY_BAR_LENGTH = 30  # Also used by the disk usage bars
+MEMORY_BARS = _build_bar_prefixes(MEMORY_BAR_LENGTH)
+_bar_tables = {CPU_BAR_LENGTH: CPU_BARS, MEMORY_BAR_LENGTH: MEMORY_BARS}
+
+def _usage_bar(percentage, bar_length):
+    """Returns a usage bar from the prebuilt prefix table, followed by the formatted percentage."""
+    table = _bar_tables.get(bar_length)
+    if table is None:
+        table = _bar_tables[bar_length] = _build_bar_prefixes(bar_length)
+    # The fill is found with integer arithmetic when the table is built (pct_bucket * bar_length // 10000),
+    # so a lookup only needs the integer bucket; clamp it only when it is out of range
+    pct_bucket = int(percentage * 100)
+    if not 0 <= pct_bucket <= 10000:
+        pct_bucket = 0 if pct_bucket < 0 else 10000
+    return table[pct_bucket] + f"{percentage:6.2f}%{RESET_COLOR}"
 
 def create_cpu_usage_bar(percentage, bar_length=10):
     """Returns a string representing an ASCII bar chart of CPU usage with color."""
-    color = get_usage_color(percentage)
-    num_bars = int((percentage / 100) * bar_length)
-    return f"{color}[{'#' * num_bars}{' ' * (bar_length - num_bars)}] {percentage:6.2f}%{RESET_COLOR}"
+    return _usage_bar(percentage, bar_length)
 
 def create_memory_usage_bar(percentage, bar_length=30):
     """Returns a string representing an ASCII bar chart of memory usage with color."""
-    color = get_usage_color(percentage)
-    num_bars = int((percentage / 100) * bar_length)
-    return f"{color}[{'#' * num_bars}{' ' * (bar_length - num_bars)}] {percentage:6.2f}%{RESET_COLOR}"
+    return _usage_bar(percentage, bar_length)
 
 def create_disk_usage_bar(percentage, bar_length=30):
     """
@@ -89,9 +227,7 @@ def create_disk_usage_bar(percentage, bar_length=30):
         str: A string representing the colored ASCII bar chart of disk usage.
     """
 
-    color = get_usage_color(percentage)
-    num_bars = int((percentage / 100) * bar_length)
-    return f"{color}[{'#' * num_bars}{' ' * (bar_length - num_bars)}] {percentage:6.2f}%{RESET_COLOR}"
+    return _usage_bar(percentage, bar_length)
 
 def display_disk_usage():
     """
@@ -101,12 +237,11 @@ def display_disk_usage():
 
     def format_size(size):
         """Helper function to format the size in GB or TB."""
-        if size >= 1024 ** 4:  # Size in TB
-            return f"{size / (1024 ** 4):.2f} TB"
+        if size >= _TB:  # Size in TB
+            return f"{size * _INV_TB:.2f} TB"
         else:  # Size in GB
-            return f"{size / (1024 ** 3):.2f} GB"
+            return f"{size * _INV_GB:.2f} GB"
 
-    disk_usage_header = f"{DISK_COLOR}=== Disk Usage ==={RESET_COLOR}"
     partitions = psutil.disk_partitions()
     table_data = []
     for partition in partitions:
@@ -130,19 +265,18 @@ def display_disk_usage():
                 "Permission Denied"
             ])
 
-    headers = ["Mountpoint", "Total", "Used", "Free", "Usage"]
+    headers = ("Mountpoint", "Total", "Used", "Free", "Usage")
     colalign = ("left", "right", "right", "right", "left")
-    table = tabulate(table_data, headers=headers, tablefmt="pretty", colalign=colalign)
-    return f"{disk_usage_header}\n" + table + "\n"
+    return [DISK_USAGE_HEADER, *_format_table(headers, table_data, colalign), ""]
 
 def display_memory_usage():
     """
     Display the current memory and swap usage statistics.
     This function retrieves memory and swap usage information using the `psutil` library,
-    formats the data, and prints it in a human-readable format. The output includes the
+    formats the data, and returns it as lines in a human-readable format. The output includes the
     total, used, and available memory in gigabytes (GB), as well as a visual representation
     of memory usage as a bar.
-    The function prints the following information:
+    The function returns the following information:
     - Total memory in GB
     - Used memory in GB
     - Available memory in GB
@@ -151,7 +285,7 @@ def display_memory_usage():
         This function assumes that the `psutil` library is installed and available.
         It also uses some global variables for color formatting (`MEMORY_COLOR`, `RESET_COLOR`).
     Example:
-        >>> display_memory_usage()
+        >>> print("\n".join(display_memory_usage()))
         === Memory Usage ===
         Total: 16.00 GB | Used: 8.00 GB | Available: 7.50 GB | [##########          ]
     """
@@ -161,16 +295,88 @@ def display_memory_usage():
     # TODO: we could consider displaying the swap usage as well
 
     # get Memory Usage in a nice format
-    memory_usage_header = f"{MEMORY_COLOR}=== Memory Usage ==={RESET_COLOR}"
     memory_usage_info = (
-        f"Total: {f'{memory_info.total / (1024 ** 3):.2f} GB'} | "
-        f"Used: {f'{memory_info.used / (1024 ** 3):.2f} GB'} | "
-        f"Available: {f'{memory_info.available / (1024 ** 3):.2f} GB'} | "
+        f"Total: {memory_info.total * _INV_GB:.2f} GB | "
+        f"Used: {memory_info.used * _INV_GB:.2f} GB | "
+        f"Available: {memory_info.available * _INV_GB:.2f} GB | "
         f"{f'{create_memory_usage_bar(memory_info.percent)}'}"
     )
-    return f"{memory_usage_header}\n{memory_usage_info}\n"
+    return [MEMORY_USAGE_HEADER, memory_usage_info, ""]
+
+# Cumulative (busy, total) clock ticks per core from the previous /proc/stat snapshot
+_prev_cpu_times = array.array('Q')
 
-def get_cpu_columns(column_width):
+def get_cpu_percentages():
+    """
+    Get the usage percentage of each core since the previous call.
+    On Linux, `/proc/stat` is read with a single read and parsed in one pass, and the busy
+    and total ticks of each core are diffed against the previous snapshot, stored as a flat
+    array. Elsewhere this falls back to `psutil.cpu_percent(interval=None, percpu=True)`.
+    Neither blocks; the collector primes this once at startup, so the first real sample
+    covers a known interval.
+    Returns:
+        list[float]: The usage percentage of each core, rounded to one decimal.
+    """
+
+    global _prev_cpu_times
+    try:
+        with open('/proc/stat', 'rb') as f:
+            buf = f.read()
+    except OSError:
+        return psutil.cpu_percent(interval=None, percpu=True)  # Non-blocking, since the previous call
+
+    # Per-core lines come right after the aggregate "cpu " line: cpuN user nice system idle iowait irq softirq steal ...
+    times = array.array('Q')
+    for line in buf.splitlines()[1:]:
+        if not line.startswith(b'cpu'):
+            break
+        user, nice, system, idle, iowait, irq, softirq, steal = map(int, line.split()[1:9])
+        busy = user + nice + system + irq + softirq + steal
+        times.append(busy)
+        times.append(busy + idle + iowait)
+
+    prev = _prev_cpu_times
+    if len(prev) != len(times):  # First call, or a core went on/offline: diff against boot
+        prev = array.array('Q', bytes(times.itemsize * len(times)))
+    _prev_cpu_times = times
+
+    cpu_percentages = []
+    for i in range(0, len(times), 2):
+        busy_delta = times[i] - prev[i]
+        total_delta = times[i + 1] - prev[i + 1]
+        if total_delta > 0:
+            cpu_percentages.append(round(min(max(100 * busy_delta / total_delta, 0.0), 100.0), 1))
+        else:
+            cpu_percentages.append(0.0)
+    return cpu_percentages
+
+def query_terminal_size():
+    """
+    Ask the terminal for its size. Unlike shutil.get_terminal_size(), this ignores $COLUMNS
+    and $LINES, which keep their value from startup when exported and would hide every resize.
+    Returns:
+        tuple: The width and height of the terminal, or 80x24 if stdout is not a terminal.
+    """
+
+    try:
+        size = os.get_terminal_size(sys.__stdout__.fileno())
+    except (AttributeError, ValueError, OSError):
+        return 80, 24
+    return size.columns or 80, size.lines or 24
+
+# Terminal size, refreshed by the SIGWINCH handler instead of being queried every frame
+_term_cols, _term_rows = query_terminal_size()
+
+def update_terminal_size(signum=None, frame=None):
+    """
+    Refresh the cached terminal size. Installed as the SIGWINCH handler, and polled
+    every few ticks on platforms without that signal.
+    """
+
+    global _term_cols, _term_rows
+    _term_cols, _term_rows = query_terminal_size()
+
+def get_cpu_columns(column_width, terminal_width=None):
     """
     Determine the number of CPU columns to display based on the terminal width.
     This function calculates the number of columns to use for displaying CPU information
@@ -178,6 +384,7 @@ def get_cpu_columns(column_width):
     1 and 5, where 1 indicates a narrow terminal and 5 indicates an extra extra wide terminal.
     Args:
         column_width (int): The width of a single column.
+        terminal_width (int, optional): The width of the terminal. Defaults to the cached width.
     Returns:
         int: The number of columns to use for displaying CPU information. Possible values are:
              - 1: Narrow terminal
@@ -185,185 +392,419 @@ def get_cpu_columns(column_width):
              - 3: Wide terminal
              - 4: Extra wide terminal
              - 5: Extra extra wide terminal
-             - 2: Default if terminal size cannot be determined
+             Always at least 1, the width falls back to 80 columns if it cannot be determined.
     """
 
-    try:
-        terminal_width = os.get_terminal_size().columns
-        return terminal_width // column_width
-    except OSError:
-        return 1  # Default to 2 columns if terminal size cannot be determined
+    if terminal_width is None:
+        terminal_width = _term_cols
+    return max(terminal_width // column_width, 1)
 
-def display_cpu_usage_in_columns():
+@functools.lru_cache(maxsize=16)
+def _cpu_layout(num_cores, max_bar_length, terminal_width):
     """
-    Display CPU usage for each core in a formatted column layout.
-    This function retrieves the CPU usage percentages for each core,
-    formats them into columns based on the terminal width, and prints
-    the usage bars along with the core labels. It also prints the average
-    CPU usage at the end.
+    Compute the layout of the CPU section. It only depends on the number of cores, the bar
+    length and the terminal width, which are stable between resizes, so it is memoized.
+    Args:
+        num_cores (int): The number of cores displayed.
+        max_bar_length (int): The visible length of the longest bar.
+        terminal_width (int): The width of the terminal.
+    Returns:
+        tuple: The "Core <n>: " label of each core, the width of a column, the number of
+            columns, and the blank entry used to fill the last row.
     """
 
-    cpu_usage_header = f"{CPU_COLOR}=== CPU Usage ==={RESET_COLOR}"
-
-    cpu_percentages = psutil.cpu_percent(percpu=True)
-
-    # Determine the width needed for the core labels, bars, and percentages
-    num_cores = len(cpu_percentages)
-
     core_label_width = len("Core ")  # Default width for the core label
     core_number_width = len(str(num_cores))  # Width of the core number
     core_joined_label_width = core_label_width+core_number_width  # Width of the core label with number
-    max_bar_length = max(len(create_cpu_usage_bar(p).rstrip()) for p in cpu_percentages)-lencolors # Max bar length for the bars, the minus lencolors is to remove the html color codes
 
     # Total column width (bar + percentage + spacing)
     column_width = core_joined_label_width + max_bar_length + len(": ") + 5 # Extra space for padding to match with the bar padding in loop below
 
     # Determine the number of columns based on terminal width and the column display width
-    columns = get_cpu_columns(column_width) # just do one less column
-
-    # Prepare rows for display based on the number of columns
-    row_format = "".join([f"{{:<{column_width}}}" for _ in range(columns)])
-
-    # Prepare the data to be displayed in rows
-    row_data = []
-    cpu_usage_rows = ""
-    for i, percentage in enumerate(cpu_percentages):
-        bar = create_cpu_usage_bar(percentage)
-        entry = f"Core {i:>{core_number_width}}: {bar}  "
-        row_data.append(entry)
-
-        # When we have enough data for a full row or it's the last core, append the row
-        if (i + 1) % columns == 0 or i == len(cpu_percentages) - 1:
-            # Pad the row if necessary (if not enough columns are filled)
-            while len(row_data) < columns:
-                row_data.append(" " * column_width)  # Add empty string to fill the columns
-            cpu_usage_rows += row_format.format(*row_data) + "\n"
-            row_data = []  # Reset for the next row
+    columns = get_cpu_columns(column_width, terminal_width)
+    labels = tuple(f"Core {i:>{core_number_width}}: " for i in range(num_cores))
+    return labels, column_width, columns, " " * column_width
+
+def display_cpu_usage_in_columns(cpu_percentages=None, terminal_width=None):
+    """
+    Display CPU usage for each core in a formatted column layout.
+    This function retrieves the CPU usage percentages for each core,
+    formats them into columns based on the terminal width, and returns
+    the lines of usage bars along with the core labels. The average
+    CPU usage is added at the end.
+    Args:
+        cpu_percentages (list[float], optional): The per-core usage to display. Sampled with
+            get_cpu_percentages() if not given.
+        terminal_width (int, optional): The width of the terminal. Defaults to the cached width.
+    """
+
+    if cpu_percentages is None:
+        cpu_percentages = get_cpu_percentages()
+    if terminal_width is None:
+        terminal_width = _term_cols
+
+    # Determine the width needed for the core labels, bars, and percentages
+    num_cores = len(cpu_percentages)
+
+    max_bar_length = CPU_BAR_LENGTH + 10  # Visible length of a bar: "[", the bar, "] " and the percentage, e.g. " 42.00%"
+    labels, column_width, columns, padding = _cpu_layout(num_cores, max_bar_length, terminal_width)
+
+    # Build all the entries at once, pad them to a whole number of rows, and join them row by row.
+    # Only the bars change between frames, the core labels come with the layout
+    entries = [
+        (label + create_cpu_usage_bar(percentage) + "  ").ljust(column_width)
+        for label, percentage in zip(labels, cpu_percentages)
+    ]
+    entries += [padding] * (-len(entries) % columns)  # Fill the columns of the last row
+    cpu_usage_rows = ["".join(entries[i:i + columns]) for i in range(0, len(entries), columns)]
     average_cpu_usage = sum(cpu_percentages) / len(cpu_percentages)
     average_cpu_usage_string = f"Average CPU Usage: {create_cpu_usage_bar(average_cpu_usage)}"
-    return f'{cpu_usage_header}\n{cpu_usage_rows}{average_cpu_usage_string}\n'
+    return [CPU_USAGE_HEADER, *cpu_usage_rows, average_cpu_usage_string, ""]
+
+# Number of CPUs (cores), used to normalize the per-user CPU usage
+_NUM_CPUS = psutil.cpu_count()
+
+# Host facts that do not change while running
+_BOOT_TIME = psutil.boot_time()
+_KERNEL_RELEASE = platform.release()  # os.uname() is not available on Windows
+_NODENAME = platform.node().capitalize()
+
+# Constants for reading processes straight from /proc
+_HAVE_PROCFS = os.path.exists('/proc/self/stat')
+_CLK_TCK = os.sysconf('SC_CLK_TCK') if _HAVE_PROCFS else 100
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if _HAVE_PROCFS else 4096
+_TOTAL_MEMORY = psutil.virtual_memory().total
+
+# (cpu ticks, start time, sample time) of each pid when it was last read from /proc
+_prev_proc_times = {}
+
+# Cache of uid to username lookups
+_uid_name = {}
+
+def read_stat(pid):
+    """
+    Read the fields of `/proc/<pid>/stat` that follow the process name.
+    The name is in parentheses and may itself contain spaces, so the split starts after the
+    last closing parenthesis: index 0 is field 3 (state) of proc(5), index 11 is field 14.
+    Args:
+        pid (int): The process id.
+    Returns:
+        list[bytes]: The fields from the state onwards.
+    """
+
+    with open(f"/proc/{pid}/stat", "rb") as f:
+        return f.read().rpartition(b")")[2].split()
+
+def get_proc_uid(pid):
+    """
+    Get the real uid of a process, as psutil reports it, from the "Uid:" line of its status file.
+    One read covers every process: the owner of the `/proc/<pid>` directory would be the
+    effective uid instead, and root for processes that are not dumpable.
+    Args:
+        pid (int): The process id.
+    Returns:
+        int: The real uid of the process.
+    """
+
+    with open(f"/proc/{pid}/status", "rb") as f:
+        status = f.read()
+    return int(status[status.index(b"\nUid:") + 5:].split(None, 1)[0])
+
+def get_username(uid):
+    """
+    Returns the username for a uid, or the uid itself if it has no passwd entry.
+    Each uid is only looked up once: getpwuid() may go through NSS, and on LDAP-joined
+    hosts even over the network.
+    """
+    username = _uid_name.get(uid)
+    if username is None:
+        try:
+            username = pwd.getpwuid(uid).pw_name
+        except KeyError:
+            username = str(uid)
+        _uid_name[uid] = username
+    return username
+
+def collect_process_usage_procfs(pids, prune=True):
+    """
+    Collect the username, CPU and memory usage of the given processes by reading `/proc` directly.
+    CPU usage is the utime + stime delta since the process was last read over the elapsed time,
+    and memory usage is the resident set size over the total memory, both in percent. A process
+    read for the first time reports 0.0 CPU usage, as with psutil. The values are summed per
+    user while reading, so no per-process data is kept.
+    Args:
+        pids (list[int]): The processes to read.
+        prune (bool, optional): Forget the previous readings of the processes not in `pids`.
+            Only pass True when `pids` holds every running process. Defaults to True.
+    Returns:
+        dict[str, list]: The [CPU usage, memory usage, process count] of each username.
+    """
+
+    global _prev_proc_times
+    now = time.monotonic()
+    memory_scale = 100 * _PAGE_SIZE / _TOTAL_MEMORY
+    prev_times = _prev_proc_times
+    proc_times = {} if prune else prev_times
+
+    # The loop runs once per process: bind the lookups it repeats to locals
+    user_usage = {}
+    get_usage = user_usage.get
+    get_prev = prev_times.get
+    get_cached_username = _uid_name.get
+    clk_tck = _CLK_TCK
+    for pid in pids:
+        try:
+            fields = read_stat(pid)
+            uid = get_proc_uid(pid)
+        except (OSError, ValueError):  # The process exited in the meantime
+            continue
+
+        cpu_ticks = int(fields[11]) + int(fields[12])  # utime + stime
+        start_time = fields[19]
+        prev = get_prev(pid)
+        proc_times[pid] = (cpu_ticks, start_time, now)
+
+        username = get_cached_username(uid) or get_username(uid)
+        usage = get_usage(username)
+        if usage is None:
+            usage = user_usage[username] = [0.0, 0.0, 0]
+        if prev is not None and prev[1] == start_time and now > prev[2]:  # Same process, not a reused pid
+            usage[0] += (cpu_ticks - prev[0]) * 100 / (clk_tck * (now - prev[2]))
+        usage[1] += int(fields[21]) * memory_scale  # rss, in pages
+        usage[2] += 1
+
+    _prev_proc_times = proc_times
+    return user_usage
+
+def collect_process_usage_psutil(pids):
+    """
+    Collect the username, CPU and memory usage of the given processes through psutil.
+    Used where `/proc` is not available. `psutil.process_iter()` keeps its own Process objects
+    across calls (pruning exited processes and detecting reused pids), which cpu_percent()
+    needs to measure since the previous scan. The attributes are only fetched for the processes
+    in `pids`, in one oneshot() each (as_dict()), so sampling skips the others entirely.
+    Usage that cannot be read (access denied) counts as 0.0, the process itself is still counted.
+    Args:
+        pids (list[int]): The processes to read.
+    Returns:
+        dict[str, list]: The [CPU usage, memory usage, process count] of each username.
+    """
+
+    pids = set(pids)
+    user_usage = {}
+    get_usage = user_usage.get
+    for proc in psutil.process_iter():
+        if proc.pid not in pids:
+            continue
+        try:
+            info = proc.as_dict(['username', 'cpu_percent', 'memory_percent'], ad_value=None)
+        except psutil.NoSuchProcess:  # The process exited in the meantime
+            continue
+        username = info['username']
+        if not username:  # Ensure the process has a valid username
+            continue
+        usage = get_usage(username)
+        if usage is None:
+            usage = user_usage[username] = [0.0, 0.0, 0]
+        usage[0] += info['cpu_percent'] or 0.0
+        usage[1] += info['memory_percent'] or 0.0
+        usage[2] += 1
+    return user_usage
+
+# Sampling of the per-user aggregation: most scans only read a random fraction of the processes,
+# scale their totals up and blend them into a moving average; every few scans read them all
+USER_SAMPLE_FRACTION = 0.2
+USER_SAMPLE_MIN_PROCESSES = 1000  # Below this, every scan reads all processes
+USER_EWMA_ALPHA = 0.3
+USER_FULL_SCAN_INTERVAL = 10  # In scans
+
+# Moving average of the per-user usage, and the number of scans done so far
+_user_ewma = {}
+_user_scan_count = 0
+
+# Border and header lines of the user table, keyed by the column widths
+_user_widths = {}
+
+def _pct_cell(percentage, cell, width):
+    """Returns a formatted percentage right-aligned on its visible width, colored by its value."""
+    return f"{' ' * (width - len(cell))}{get_usage_color(percentage)}{cell}{RESET_COLOR}"
 
 def display_user_usage():
     """
     Display cumulative CPU, memory usage, and process count for each user.
     This function iterates over all running processes, accumulates CPU and memory usage,
     and counts the number of processes for each user. It then filters users based on
-    specified CPU and memory usage thresholds and displays the results in a formatted table.
+    specified CPU and memory usage thresholds and returns the lines of a formatted table.
+    On hosts with many processes, most scans only read a random sample of them and blend the
+    scaled-up totals into a moving average, with a full scan every USER_FULL_SCAN_INTERVAL scans.
     """
 
-    cumulative_user_usage_header = f"{USER_COLOR}=== Cumulative User CPU, Memory Usage, and Process Count ==={RESET_COLOR}"
-
     # Define thresholds
     cpu_threshold = 0.01  # CPU usage threshold in percent
     memory_threshold = 0.01  # Memory usage threshold in percent
 
-    # Dictionary to store cumulative CPU, memory usage, and process count for each user
-    user_usage = defaultdict(lambda: {'cpu': 0.0, 'memory': 0.0, 'processes': 0})
-
-    # Get the number of CPUs (cores)
-    num_cpus = psutil.cpu_count()
-
-    for proc in psutil.process_iter(['pid', 'name', 'username', 'cpu_percent', 'memory_percent']):
-        try:
-            # Get process information
-            proc_info = proc.info
-            username = proc_info['username']
-            if username:  # Ensure the process has a valid username
-                # Accumulate the CPU and memory usage for each user
-                user_data = user_usage[username]
-                user_data['cpu'] += proc_info['cpu_percent']
-                user_data['memory'] += proc_info['memory_percent']
-                # Increment the process count for the user
-                user_data['processes'] += 1
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-            continue
+    # Read every process on a full scan or on small hosts, otherwise only a random sample of them
+    global _user_ewma, _user_scan_count
+    pids = psutil.pids()
+    full_scan = _user_scan_count % USER_FULL_SCAN_INTERVAL == 0 or len(pids) < USER_SAMPLE_MIN_PROCESSES
+    _user_scan_count += 1
+    if full_scan:
+        pids_read = pids
+    else:
+        pids_read = random.sample(pids, int(len(pids) * USER_SAMPLE_FRACTION))
+    scale = len(pids) / len(pids_read) if pids_read else 1.0
 
-    # Filter users based on the thresholds
-    filtered_user_data = [
-        {
-            'Username': user,
-            'CPU Usage (%)': f"{get_usage_color((usage['cpu'] / num_cpus))}{(usage['cpu'] / num_cpus):.2f}{RESET_COLOR}",
-            'Memory Usage (%)': f"{get_usage_color(usage['memory'])}{usage['memory']:.2f}{RESET_COLOR}",
-            'Process Count': usage['processes']
-        }
-        for user, usage in user_usage.items()
-        if (usage['cpu'] / num_cpus) > cpu_threshold or usage['memory'] > memory_threshold
+    # Sum the usage per user in a single pass over the processes
+    if _HAVE_PROCFS:
+        user_usage = collect_process_usage_procfs(pids_read, prune=full_scan)
+    else:
+        user_usage = collect_process_usage_psutil(pids_read)
+    if scale != 1.0:
+        for usage in user_usage.values():
+            usage[0] *= scale
+            usage[1] *= scale
+            usage[2] *= scale
+
+    # A full scan is exact and resets the moving average, a sample is blended into it.
+    # Users missing from the sample decay towards zero and are dropped once negligible.
+    if not full_scan:
+        blended = {}
+        for user in [*_user_ewma, *(user for user in user_usage if user not in _user_ewma)]:
+            old = _user_ewma.get(user)
+            new = user_usage.get(user, (0.0, 0.0, 0.0))
+            if old is None:
+                blended[user] = new
+                continue
+            usage = [USER_EWMA_ALPHA * new_value + (1 - USER_EWMA_ALPHA) * old_value for new_value, old_value in zip(new, old)]
+            if usage[2] >= 0.5:
+                blended[user] = usage
+        user_usage = blended
+    _user_ewma = user_usage
+
+    # Filter users based on the thresholds, formatting the cells and measuring the columns as we go
+    headers = ("Username", "CPU Usage (%)", "Memory Usage (%)", "Process Count")
+    user_width, cpu_width, memory_width, count_width = map(len, headers)
+    filtered_user_data = []
+    for user, (cpu, memory, processes) in user_usage.items():
+        cpu /= _NUM_CPUS
+        if cpu > cpu_threshold or memory > memory_threshold:
+            cpu_cell = f"{cpu:.2f}"
+            memory_cell = f"{memory:.2f}"
+            count_cell = str(round(processes))
+            user_width = max(user_width, len(user))
+            cpu_width = max(cpu_width, len(cpu_cell))
+            memory_width = max(memory_width, len(memory_cell))
+            count_width = max(count_width, len(count_cell))
+            filtered_user_data.append((user, cpu_cell, memory_cell, count_cell, cpu, memory))
+
+    if not filtered_user_data:
+        return ["No users exceed the specified thresholds.", ""]
+
+    widths = (user_width, cpu_width, memory_width, count_width)
+    layout = _user_widths.get(widths)
+    if layout is None:
+        layout = _user_widths[widths] = _table_layout(headers, widths, ("left", "right", "right", "right"))
+
+    # Display the filtered data in a table, padding the colored cells on their visible width
+    border, header_line = layout
+    rows = [
+        " | ".join((
+            "| " + user.ljust(user_width),
+            _pct_cell(cpu, cpu_cell, cpu_width),
+            _pct_cell(memory, memory_cell, memory_width),
+            count_cell.rjust(count_width) + " |",
+        ))
+        for user, cpu_cell, memory_cell, count_cell, cpu, memory in filtered_user_data
     ]
+    return [USER_USAGE_HEADER, border, header_line, border, *rows, border, ""]
 
-    # Display the filtered data in a table
-    if filtered_user_data:
-        colalign = ("left", "right", "right", "right")
-        return f'{cumulative_user_usage_header}\n' + tabulate(filtered_user_data, headers='keys', tablefmt="pretty", colalign=colalign) + "\n"
-    else:
-        return "No users exceed the specified thresholds.\n"
+# Column widths and the border and header lines of the network table, keyed by the set of interfaces
+_net_widths = {}
 
 def display_network_usage():
     """
     Display network usage statistics including bytes sent, bytes received,
     packets sent, and packets received for each network interface.
+    The table layout only depends on the interface names, which almost never change,
+    so it is computed once per set of interfaces and reused.
     """
 
-    network_usage_header = f"{NETWORK_COLOR}=== Network Usage ==={RESET_COLOR}"
-
     net_io = psutil.net_io_counters(pernic=True) # Get network I/O statistics per network interface
 
-    # Column titles
-    coltitle_interface = "Interface"
-    coltitle_megabytes_sent = "Bytes Sent (MB)"
-    coltitle_megabytes_recv = "Bytes Received (MB)"
-    coltitle_packets_sent = "Packets Sent"
-    coltitle_packets_recv = "Packets Received"
-
     table_data = []
     for interface, stats in net_io.items():
-        row = [
+        row = (
             interface,
-            f"{stats.bytes_sent / (1024 ** 2):.2f}",
-            f"{stats.bytes_recv / (1024 ** 2):.2f}",
-            stats.packets_sent,
-            stats.packets_recv
-        ]
+            f"{stats.bytes_sent * _INV_MB:.2f}",
+            f"{stats.bytes_recv * _INV_MB:.2f}",
+            str(stats.packets_sent),
+            str(stats.packets_recv)
+        )
         table_data.append(row)
 
-    headers = [coltitle_interface, coltitle_megabytes_sent, coltitle_megabytes_recv, coltitle_packets_sent, coltitle_packets_recv]
-    colalign = ("left", "right", "right", "right", "right")
-    table = tabulate(table_data, headers=headers, tablefmt="pretty", colalign=colalign)
-    return f"{network_usage_header}\n{table}\n"
+    key = frozenset(net_io)
+    layout = _net_widths.get(key)
+    if layout is None or any(len(cell) > width for row in table_data for cell, width in zip(row[1:], layout[0][1:])):
+        # Column titles
+        coltitle_interface = "Interface"
+        coltitle_megabytes_sent = "Bytes Sent (MB)"
+        coltitle_megabytes_recv = "Bytes Received (MB)"
+        coltitle_packets_sent = "Packets Sent"
+        coltitle_packets_recv = "Packets Received"
+        headers = (coltitle_interface, coltitle_megabytes_sent, coltitle_megabytes_recv, coltitle_packets_sent, coltitle_packets_recv)
+
+        # The counters only grow, so the numeric columns are sized on the current values and
+        # only get recomputed once a counter outgrows its column
+        widths = [max([len(header)] + [len(row[i]) for row in table_data]) for i, header in enumerate(headers)]
+        layout = _net_widths[key] = (widths, *_table_layout(headers, widths, ("left", "right", "right", "right", "right")))
+
+    widths, border, header_line = layout
+    interface_width = widths[0]
+    rows = [
+        "| " + row[0].ljust(interface_width) + " | " + " | ".join(
+            cell.rjust(width) for cell, width in zip(row[1:], widths[1:])) + " |"
+        for row in table_data
+    ]
+    return [NETWORK_USAGE_HEADER, border, header_line, border, *rows, border, ""]
 
 def display_load_average():
     """
     Display the system load averages for the past 1, 5, and 15 minutes.
     """
 
-    load_average_header = f"{LOAD_COLOR}=== Load Average ==={RESET_COLOR}"
-
-    load_avg = os.getloadavg()  # Returns a tuple of (1min, 5min, 15min load averages)
+    load_avg = psutil.getloadavg()  # Returns a tuple of (1min, 5min, 15min load averages), emulated on Windows
     load_averages = (f"1 min: {load_avg[0]:.2f} | "
                     f"5 min: {load_avg[1]:.2f} | "
                     f"15 min: {load_avg[2]:.2f}")
-    return f"{load_average_header}\n{load_averages}\n"
+    return [LOAD_AVERAGE_HEADER, load_averages, ""]
 
 def display_system_info():
     """
     Displays system information including uptime and kernel version.
     """
 
-    system_info_header = f"{INFO_COLOR}=== System Info ==={RESET_COLOR}"
-    uptime_seconds = time.time() - psutil.boot_time()
+    uptime_seconds = time.time() - _BOOT_TIME
     uptime = time.strftime("%H:%M:%S", time.gmtime(uptime_seconds))
-    kernel_version = os.uname().release
-    return f"{system_info_header}\nUptime: {uptime}\nKernel Version: {kernel_version}\n"
+    kernel_version = _KERNEL_RELEASE
+    return [SYSTEM_INFO_HEADER, f"Uptime: {uptime}", f"Kernel Version: {kernel_version}", ""]
+
+# Per-disk I/O counters from the previous call, and when they were sampled (time.monotonic())
+_prev_disk_io = {}
+_prev_disk_io_time = None
 
-def display_disk_io():
+def display_disk_io(terminal_width=None):
     """
     Display live disk I/O statistics including read and write bytes for each disk.
+    The speeds are measured since the previous call, and are zero on the first one.
+    Args:
+        terminal_width (int, optional): The width of the terminal. Defaults to the cached width.
     """
 
-    # Define header
-    disk_io_header = (f"{DISK_COLOR}=== Disk I/O ==={RESET_COLOR}")
+    global _prev_disk_io, _prev_disk_io_time
 
     # Get disk I/O statistics
     disk_io = psutil.disk_io_counters(perdisk=True)
+    now = time.monotonic()
 
     # Column titles
     coltitle_disk = "Disk"
@@ -377,55 +818,359 @@ def display_disk_io():
     header = (f"{HEADER_COLOR}{coltitle_disk.ljust(disk_width)} | "
               f"{coltitle_readwrite_speed.ljust(max_readwrite_speed_len)}{RESET_COLOR}")
 
-    # Determine the width of the combined tables
-    combined_width = disk_width+max_readwrite_speed_len  # Adding some space between the tables
+    # Determine the width of a row of one table, and of the combined tables: each table but
+    # the last is followed by a space
+    row_width = disk_width + len(" | ") + max_readwrite_speed_len
+    combined_width = row_width + 1
 
-    # Store previous I/O stats to calculate speed
-    prev_disk_io = psutil.disk_io_counters(perdisk=True)
-    poll_interval = 0.01  # Polling interval in seconds
-    time.sleep(poll_interval)  # Sleep for 1 second to calculate speed
-    curr_disk_io = psutil.disk_io_counters(perdisk=True)
+    # Compare with the I/O stats of the previous call to calculate speed
+    prev_disk_io = _prev_disk_io
+    elapsed = now - _prev_disk_io_time if _prev_disk_io_time is not None else 0.0
+    to_mb_per_second = _INV_MB / elapsed if elapsed > 0 else 0.0
+    _prev_disk_io, _prev_disk_io_time = disk_io, now
 
     # Get the console width
-    terminal_width = os.get_terminal_size().columns
+    if terminal_width is None:
+        terminal_width = _term_cols
 
     # Check if the terminal width is sufficient to display tables side by side
-    N = min(terminal_width // combined_width, 10)
+    N = min((terminal_width + 1) // combined_width, 10)
     N = max(N, 1)  # Ensure at least 1 table is displayed
 
     # Data rows
     tables = [[] for _ in range(N)]  # Create N empty tables
-    for i, (disk, stats) in enumerate(curr_disk_io.items()):
-        prev_stats = prev_disk_io[disk]
-        read_speed = (1.0 / poll_interval) * (stats.read_bytes - prev_stats.read_bytes) / (1024 ** 2)  # MB/s
-        write_speed = (1.0 / poll_interval) * (stats.write_bytes - prev_stats.write_bytes) / (1024 ** 2)  # MB/s
-        row = f"{disk.ljust(disk_width)} | {read_speed:.2f}/{write_speed:.2f}".ljust(max_readwrite_speed_len)
+    for i, (disk, stats) in enumerate(disk_io.items()):
+        prev_stats = prev_disk_io.get(disk)
+        if prev_stats is None or elapsed <= 0:  # First sample of this disk
+            read_speed = write_speed = 0.0
+        else:
+            read_speed = (stats.read_bytes - prev_stats.read_bytes) * to_mb_per_second  # MB/s
+            write_speed = (stats.write_bytes - prev_stats.write_bytes) * to_mb_per_second  # MB/s
+        row = f"{disk.ljust(disk_width)} | " + f"{read_speed:.2f}/{write_speed:.2f}".ljust(max_readwrite_speed_len)
         tables[i % N].append(row)
 
-    # Function to return tables side by side
-    def tables_side_by_side(tables):
-        max_len = max(len(table) for table in tables)
-        disk_io_rows = []
-        for i in range(max_len):
-            row_parts = []
-            for table in tables:
-                if i < len(table):
-                    row_parts.append(table[i])
-                else:
-                    row_parts.append(" " * len(header))
-            row_parts.append(" " * len(header))
-        disk_io_rows.append(" ".join(row_parts))
-        return "\n".join(disk_io_rows)
+    # Put the rows of the tables side by side. The disks are dealt round-robin, so the first table
+    # is the longest, and the others are filled up with blanks as wide as a row
+    pad = " " * row_width
+    disk_io_rows = [
+        " ".join([table[i] if i < len(table) else pad for table in tables])
+        for i in range(len(tables[0]))
+    ]
 
-    return f'{disk_io_header}\n' + header +'\n'+ tables_side_by_side(tables)
+    return [DISK_IO_HEADER, header, *disk_io_rows]
 
-def clear_console():
+def enable_ansi_escapes():
     """
-    Clears the console screen. Works on both Windows and Unix-like systems.
+    Enables the processing of ANSI escape codes by the Windows console
+    (ENABLE_VIRTUAL_TERMINAL_PROCESSING). Does nothing on other systems.
     """
 
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if os.name != 'nt':
+        return
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+    mode = ctypes.c_uint32()
+    if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+        kernel32.SetConsoleMode(handle, mode.value | 0x0004)
+
+# How often each section is refreshed, in ticks of the update interval. Slow-moving metrics
+# are re-queried less often and their previously rendered lines are reused in between.
+SCHEDULE = {
+    'disk': 20,
+    'mem': 1,
+    'cpu': 1,
+    'users': 2,
+    'net': 5,
+    'load': 4,
+    'system': 1,  # Uptime is shown to the second
+    'disk_io': 1,
+}
+
+# The per-user aggregation is skipped while the average CPU usage moves less than this
+# (in percent) since the last aggregation, but never for more than the given number of ticks
+USER_CPU_DELTA_THRESHOLD = 1.0
+USER_MAX_SKIPPED_TICKS = 10
+
+# The CPU section keeps showing its previous values until a core moves by at least this much
+# (in percent), so the jitter of an idle host does not redraw it on every tick
+CPU_REDRAW_THRESHOLD = 1.0
+
+# Last rendered lines of each section, keyed by the section name in SCHEDULE
+_section_cache = {}
+
+def is_due(name, tick):
+    """Returns True if the section is scheduled to be refreshed on this tick."""
+    return tick % SCHEDULE[name] == 0
+
+def get_section(name, display, due):
+    """
+    Get the lines of a section, only calling its display function when it is due.
+    Args:
+        name (str): The name of the section in SCHEDULE.
+        display (callable): The function returning the lines of the section.
+        due (bool): Whether the section should be refreshed on this tick.
+    Returns:
+        list[str]: The freshly rendered lines, or the cached ones if the section is not due.
+    """
 
+    if due or name not in _section_cache:
+        _section_cache[name] = display()
+    return _section_cache[name]
+
+class FrameBuffer:
+    """
+    Double-buffered renderer for the terminal output.
+    The previously rendered frame is kept as a list of lines, and each new frame is diffed
+    against it line by line. Only the lines that changed are rewritten, by moving the cursor
+    to the start of the row and erasing it, so an unchanged screen costs next to nothing to
+    redraw and does not flicker. The whole frame is assembled in memory and handed to the
+    terminal in a single write.
+    The screen is never cleared as a whole: the first frame, and the first one after a reset,
+    overwrite every row and erase everything below, so there is no blank screen in between.
+    """
+
+    def __init__(self):
+        self.prev_lines = []
+        self.stale_screen = True  # The screen holds something else than the previous frame
+
+    def reset(self):
+        """Forget the previous frame, so the next one is drawn in full (e.g. after a resize)."""
+        self.prev_lines = []
+        self.stale_screen = True
+
+    def render(self, new_lines, max_rows=None):
+        """
+        Draw a frame, writing only the lines that differ from the previous frame.
+        The frame is written and flushed to stdout with a single write.
+        Args:
+            new_lines (list[str]): The lines of the new frame, without trailing newlines.
+                The list is kept to diff the next frame against, so it must not be modified.
+            max_rows (int, optional): The height of the terminal. A taller frame is cut to fit,
+                as rows past the bottom of the screen cannot be addressed.
+        """
+
+        # Keep the last row free for the cursor, and tell what was cut off
+        if max_rows is not None and len(new_lines) >= max_rows:
+            shown = max(max_rows - 2, 0)
+            new_lines = new_lines[:shown] + [
+                f"... {len(new_lines) - shown} more lines, enlarge the terminal to see them"]
+
+        prev_lines = self.prev_lines
+        out = io.StringIO()
+        out.write(SYNC_UPDATE_BEGIN + AUTOWRAP_OFF)
+        for i, line in enumerate(new_lines):
+            if i >= len(prev_lines) or prev_lines[i] != line:
+                out.write(f"\x1b[{i + 1};1H\x1b[K{line}")
+
+        # Park the cursor below the frame, erasing whatever is left of a longer previous frame,
+        # or of what was on the screen before
+        out.write(f"\x1b[{len(new_lines) + 1};1H")
+        if self.stale_screen or len(new_lines) < len(prev_lines):
+            out.write(ERASE_BELOW)
+            self.stale_screen = False
+        out.write(AUTOWRAP_ON + SYNC_UPDATE_END)
+        self.prev_lines = new_lines
+
+        # Bypass the text layer (and its line buffering) so the frame goes out in one write(2)
+        sys.stdout.flush()
+        sys.stdout.buffer.write(out.getvalue().encode(sys.stdout.encoding or "utf-8", "replace"))
+        sys.stdout.buffer.flush()
+
+
+class Snapshot:
+    """
+    The latest collected data, handed over from the collector thread to the render loop.
+    A new Snapshot is built for every collection and never modified afterwards.
+    """
+
+    def __init__(self, sections=(), cpu=(), error=None):
+        self.sections = list(sections)  # (name, lines) of the collected sections, lines is None for 'cpu'
+        self.cpu = list(cpu)  # Per-core CPU usage, formatted by the render loop itself
+        self.error = error  # Exception raised while collecting, re-raised by the render loop
+
+    def render_lines(self, header=(), footer=(), terminal_width=None):
+        """
+        Returns the lines of the whole frame, formatting the CPU section for the current terminal width.
+        Args:
+            header (sequence[str], optional): The lines to put above the sections.
+            footer (sequence[str], optional): The lines to put below the sections.
+            terminal_width (int, optional): The width of the terminal. Defaults to the cached width.
+        Returns:
+            list[str]: A new list with the lines of the frame.
+        """
+        lines = list(header)
+        for name, section_lines in self.sections:
+            lines += display_cpu_usage_in_columns(self.cpu, terminal_width) if name == 'cpu' else section_lines
+        lines += footer
+        return lines
+
+# The latest snapshot, replaced under the lock, and set whenever a new one is published
+_snapshot_lock = threading.Lock()
+_latest_snapshot = Snapshot()
+_snapshot_ready = threading.Event()
+
+# How often the render loop wakes up without a new snapshot, to pick up terminal resizes (seconds)
+RENDER_INTERVAL = 0.2
+
+# Delay between priming the CPU counters and the first collection (seconds)
+CPU_WARMUP = 0.1
+
+def publish_snapshot(snapshot):
+    """Make a snapshot the latest one and wake up the render loop."""
+    global _latest_snapshot
+    with _snapshot_lock:
+        _latest_snapshot = snapshot
+    _snapshot_ready.set()
+
+# Set when the screen may no longer show the last frame, e.g. after the shell printed over it while
+# we were stopped or in the background. The render loop then draws the next frame in full.
+# A plain flag, as it is set from a signal handler, where taking a lock could deadlock.
+_redraw_needed = False
+
+def request_redraw(signum=None, frame=None):
+    """Have the render loop redraw the whole screen. Installed as the SIGCONT handler."""
+    global _redraw_needed
+    _redraw_needed = True
+
+def is_foreground():
+    """
+    Returns False when the process runs in a background job of its terminal (e.g. sent there
+    with Ctrl-Z and `bg`), where its output is not visible. Always True when stdout is not a
+    terminal, or on platforms without job control.
+    """
+
+    if not hasattr(os, 'tcgetpgrp'):
+        return True
+    try:
+        return os.tcgetpgrp(sys.stdout.fileno()) == os.getpgrp()
+    except OSError:
+        return True
+
+def enabled_sections(args):
+    """
+    Resolve the command-line options into the sections to show, once at startup.
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments.
+    Returns:
+        list[tuple]: The name of each enabled section in SCHEDULE, its display function, and
+            whether that function takes the terminal width, in display order.
+    """
+
+    sections = [
+        ('disk', display_disk_usage, False),  # Disk usage with a bar
+        ('mem', display_memory_usage, False),  # Memory usage with a bar
+        ('cpu', None, False),  # Formatted by the render loop, based on terminal width
+        ('users', display_user_usage, False),  # Cumulative user usage with CPU normalized by number of cores
+    ]
+    if args.show_network or args.show_all:
+        sections.append(('net', display_network_usage, False))  # Network usage with aligned columns and colored headers
+    if args.show_load or args.show_all:
+        sections.append(('load', display_load_average, False))  # Load average
+    if args.show_system or args.show_all:
+        sections.append(('system', display_system_info, False))  # System uptime and kernel version
+    if args.show_disk_io or args.show_all or args.show_most:
+        sections.append(('disk_io', display_disk_io, True))
+    return sections
+
+async def fetch_section(loop, name, display, due):
+    """
+    Get the lines of a section (see get_section), calling its display function on the
+    default thread pool so the sections of a tick are queried concurrently.
+    Args:
+        loop (asyncio.AbstractEventLoop): The event loop of the collector.
+        name (str): The name of the section in SCHEDULE.
+        display (callable): The function returning the lines of the section, None for 'cpu'.
+        due (bool): Whether the section should be refreshed on this tick.
+    Returns:
+        tuple: The name of the section and its lines, None for 'cpu'.
+    """
+
+    if display is None:  # Formatted by the render loop, based on terminal width
+        return name, None
+    return name, await loop.run_in_executor(None, get_section, name, display, due)
+
+async def collector(args):
+    """
+    Collect the enabled sections every interval and publish them as the latest snapshot.
+    Runs in an event loop on a background thread, so the render loop never stalls while
+    processes are scanned. The blocking psutil calls of the sections overlap on a thread pool,
+    so a tick takes about as long as its slowest section rather than the sum of all of them.
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments.
+    """
+
+    loop = asyncio.get_event_loop()
+    enabled = enabled_sections(args)
+
+    # Prime the CPU counters, so the first sample measures a short known interval
+    get_cpu_percentages()
+    await asyncio.sleep(CPU_WARMUP)
+
+    tick = 0
+    users_tick = 0  # Tick and average CPU usage of the last per-user aggregation
+    users_average_cpu = None
+    cpu_percentages = []
+    shown_cpu = []  # Per-core CPU usage of the CPU section
+    published = None  # Sections and CPU usage of the last published snapshot
+    in_background = False
+    while True:
+        # Nothing is visible from a background job: skip the whole collection until we are back,
+        # then redraw the screen, which the shell wrote over in the meantime
+        if not is_foreground():
+            in_background = True
+            await asyncio.sleep(args.interval)
+            continue
+        if in_background:
+            in_background = False
+            request_redraw()
+
+        try:
+            if is_due('cpu', tick) or not cpu_percentages:
+                cpu_percentages = get_cpu_percentages()
+            average_cpu = sum(cpu_percentages) / len(cpu_percentages)
+            if len(cpu_percentages) != len(shown_cpu) or any(
+                    abs(new - old) >= CPU_REDRAW_THRESHOLD for new, old in zip(cpu_percentages, shown_cpu)):
+                shown_cpu = cpu_percentages
+
+            # Only aggregate the user usage again if the CPU usage moved noticeably, or it got too stale
+            users_due = is_due('users', tick) and (
+                users_average_cpu is None
+                or abs(average_cpu - users_average_cpu) >= USER_CPU_DELTA_THRESHOLD
+                or tick - users_tick >= USER_MAX_SKIPPED_TICKS
+            )
+            if users_due:
+                users_tick, users_average_cpu = tick, average_cpu
+
+            # Only the sections that are due are re-queried. The terminal width is read once,
+            # so all the sections of a tick agree on it
+            terminal_width = _term_cols
+            sections = [
+                (name,
+                 functools.partial(display, terminal_width) if takes_width else display,
+                 users_due if name == 'users' else is_due(name, tick))
+                for name, display, takes_width in enabled
+            ]
+
+            # Create the lines of all the sections at once, in their order
+            output = await asyncio.gather(*(fetch_section(loop, *section) for section in sections))
+        except Exception as error:
+            publish_snapshot(Snapshot(error=error))
+            return
+        # Only wake up the render loop if something changed. The sections that were not due are the
+        # very same lists as before, so comparing them is cheap
+        if published is None or published[0] != output or published[1] is not shown_cpu:
+            published = (output, shown_cpu)
+            publish_snapshot(Snapshot(output, shown_cpu))
+
+        # Wait for the specified interval
+        await asyncio.sleep(args.interval)  # Update based on the interval argument
+        tick += 1
+
+def run_collector(args):
+    """Run the collector in an event loop of its own, on the calling (background) thread."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    loop.run_until_complete(collector(args))
 
 if __name__ == "__main__":
 
@@ -448,34 +1193,51 @@ if __name__ == "__main__":
         return parser.parse_args()
 
     args = parse_arguments()
+    framebuffer = FrameBuffer()
+    if hasattr(signal, 'SIGWINCH'):
+        signal.signal(signal.SIGWINCH, update_terminal_size)
+    if hasattr(signal, 'SIGCONT'):
+        signal.signal(signal.SIGCONT, request_redraw)  # Resumed after Ctrl-Z
+    enable_ansi_escapes()
+    frame_cols, frame_rows = _term_cols, _term_rows
+    header = [f"{HEADER_COLOR}=== Real-Time System Resource Usage for {_NODENAME} ==={RESET_COLOR}"]
+    footer = [f"{HEADER_COLOR}========================================{RESET_COLOR}", 'Press ctrl+c to exit...']
+
+    # Collect on a background thread, the main thread only renders the latest snapshot
+    threading.Thread(target=run_collector, args=(args,), name="collector", daemon=True).start()
+    wakeups = 0
     try:
-        clear_console()  # Clear the screen
         while True:
-
-            # Create the output to be displayed
-            output = []
-            output.append(f"{HEADER_COLOR}=== Real-Time System Resource Usage for {os.uname().nodename.capitalize()} ==={RESET_COLOR}")
-            output.append(display_disk_usage())  # Disk usage with a bar
-            output.append(display_memory_usage())  # Memory usage with a bar
-            output.append(display_cpu_usage_in_columns())  # Dynamically set number of columns based on terminal width
-            output.append(display_user_usage())  # Cumulative user usage with CPU normalized by number of cores
-            if args.show_network or args.show_all:
-                output.append(display_network_usage())  # Network usage with aligned columns and colored headers
-            if args.show_load or args.show_all:
-                output.append(display_load_average())  # Load average
-            if args.show_system or args.show_all:
-                output.append(display_system_info())  # System uptime and kernel version
-            if args.show_disk_io or args.show_all or args.show_most:
-                output.append(display_disk_io())
-            output.append(f"{HEADER_COLOR}========================================{RESET_COLOR}")
-            output.append('Press ctrl+c to exit...')
-
-            # Print the output all at once
-            print("\n".join(output))
-
-            # Wait for the specified interval and clear the console
-            time.sleep(args.interval)  # Update based on the interval argument
-            clear_console()  # Clear the screen
+            new_snapshot = _snapshot_ready.wait(RENDER_INTERVAL)
+            _snapshot_ready.clear()
+            wakeups += 1
+
+            # Without SIGWINCH (Windows), poll the terminal size every 10 wake-ups instead
+            if not hasattr(signal, 'SIGWINCH') and wakeups % 10 == 0:
+                update_terminal_size()
+
+            # Stay silent in a background job (e.g. resumed with `bg`). A pending resize or redraw
+            # is kept, and done once we are back in the foreground
+            if not is_foreground():
+                continue
+            resized = (_term_cols, _term_rows) != (frame_cols, frame_rows)
+            redraw = resized or _redraw_needed
+            if redraw:  # The terminal may have reflowed or overwritten the old frame, draw it over in full
+                frame_cols, frame_rows = _term_cols, _term_rows
+                _redraw_needed = False
+                framebuffer.reset()
+            if not (new_snapshot or redraw):
+                continue
+
+            with _snapshot_lock:
+                snapshot = _latest_snapshot
+            if snapshot.error is not None:
+                raise snapshot.error
+
+            # Draw the changed lines, all at once. No data is sampled here, the CPU section is only
+            # formatted from the snapshot, so a resize reflows it right away
+            framebuffer.render(snapshot.render_lines(header, footer, frame_cols), frame_rows)
 
     except KeyboardInterrupt:
+        sys.stdout.write(AUTOWRAP_ON + SYNC_UPDATE_END)  # In case we were interrupted mid-frame
         print("\nExiting real-time monitoring.")